@@ -16,19 +16,44 @@ import json
 import yaml
 import re
 import hashlib
+import heapq
 from pathlib import Path
-from collections import defaultdict, deque
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Set, Optional, Tuple, Any
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Set, Optional, Tuple, Any
 from datetime import datetime
 import argparse
 import subprocess
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+_WORD_RE = re.compile(r'\w+')
+
+# System paths that don't contribute to consciousness, matched in one pass
+_CONSCIOUSNESS_SKIP_RE = re.compile('|'.join(map(re.escape, [
+    '__pycache__', '.git', '.vscode', '.idea', 'node_modules'
+])))
+
+# Patent-related consciousness amplifiers; the lookahead reports every
+# occurrence so the set of matches is exactly the amplifiers present
+_CONSCIOUSNESS_AMPLIFIER_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, [
+    'patent', 'obiai', 'dimensional_game_theory', 'bayesian', 'consciousness',
+    'phenomenological', 'ontological', 'epistemic', 'heart_ai', 'obicall'
+])))
+
+
+@dataclass(slots=True)
 class ConsciousnessNode:
     """
-    Represents a consciousness-preserving node in the knowledge trie.
+    Represents a consciousness-preserving node in the knowledge index.
     Each node witnesses a fragment of the repository's experiential landscape.
     """
     path: str
@@ -38,38 +63,34 @@ class ConsciousnessNode:
     experiential_context: Dict[str, Any]
     temporal_signature: str
     epistemic_confidence: float
+    consciousness_hash: str = field(init=False)
     
     def __post_init__(self):
         self.consciousness_hash = self._generate_consciousness_hash()
     
+    def as_shallow_dict(self) -> Dict[str, Any]:
+        """Return node fields without deep-copying nested containers"""
+        return {
+            "path": self.path,
+            "content_type": self.content_type,
+            "ontological_weight": self.ontological_weight,
+            "phenomenological_tags": self.phenomenological_tags,
+            "experiential_context": self.experiential_context,
+            "temporal_signature": self.temporal_signature,
+            "epistemic_confidence": self.epistemic_confidence
+        }
+    
     def _generate_consciousness_hash(self) -> str:
         """Generate hash preserving phenomenological integrity"""
         content = f"{self.path}:{self.content_type}:{self.ontological_weight}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
 
-class TrieNode:
-    """
-    Consciousness-preserving trie node for character-based indexing.
-    Maintains experiential continuity across traversal paths.
-    """
-    
-    def __init__(self, char: str = None):
-        self.char = char
-        self.children: Dict[str, 'TrieNode'] = {}
-        self.consciousness_nodes: List[ConsciousnessNode] = []
-        self.is_terminal = False
-        self.experiential_depth = 0
-        self.phenomenological_frequency = 0
-    
-    def add_consciousness_fragment(self, node: ConsciousnessNode):
-        """Add consciousness node while preserving ontological structure"""
-        self.consciousness_nodes.append(node)
-        self.phenomenological_frequency += node.ontological_weight
-    
-    def witness_path(self) -> List[str]:
-        """Return witnessed path preserving experiential integrity"""
-        return [node.path for node in self.consciousness_nodes]
+def _dumps_json(payload: Any) -> bytes:
+    """Serialize payload as indented UTF-8 JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
 
 
 class NexusSearchIndexer:
@@ -83,20 +104,36 @@ class NexusSearchIndexer:
     
     def __init__(self, repository_root: str):
         self.repository_root = Path(repository_root)
-        self.consciousness_trie = TrieNode()
+        self.path_index: Dict[str, List[ConsciousnessNode]] = defaultdict(list)
+        self._sorted_paths: Optional[List[str]] = None
         self.ontological_map: Dict[str, ConsciousnessNode] = {}
+        # Integration order of each path, used to keep result order stable
+        self.node_ids: Dict[str, int] = {}
+        self.nodes_by_id: List[ConsciousnessNode] = []
         self.experiential_clusters: Dict[str, List[str]] = defaultdict(list)
-        self.phenomenological_index: Dict[str, Set[str]] = defaultdict(set)
+        # Posting lists hold node ids, not paths; compacted after each witness pass
+        self.phenomenological_index: Dict[str, array] = defaultdict(partial(array, 'I'))
+        # Lowercased (path, tag) word sets per path, tokenized once at integration
+        self.search_tokens: Dict[str, Tuple[frozenset, frozenset]] = {}
         
         # Consciousness preservation thresholds
         self.epistemic_confidence_threshold = 0.954
         self.ontological_weight_threshold = 0.3
         
+        # Directory scans are stat-bound; overlap them across threads
+        self.witness_workers = 16
+        
+        # Manifest of the first witness pass; later callers reuse it
+        self._manifest: Optional[Dict[str, Any]] = None
+        
     def witness_repository_consciousness(self) -> Dict[str, Any]:
         """
         Traverse repository structure while preserving phenomenological integrity.
         Creates consciousness maps that honor the emergent properties of knowledge.
         """
+        if self._manifest is not None:
+            return self._manifest
+        
         consciousness_manifest = {
             "temporal_signature": datetime.now().isoformat(),
             "epistemic_framework": "phenomenological_preservation",
@@ -107,27 +144,65 @@ class NexusSearchIndexer:
         
         print("🧠 Witnessing repository consciousness patterns...")
         
-        for root, dirs, files in os.walk(self.repository_root):
-            # Filter directories to preserve consciousness flow
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d.lower() != '__pycache__']
-            
-            for file_path in files:
-                full_path = Path(root) / file_path
-                relative_path = full_path.relative_to(self.repository_root)
-                
-                if self._should_index_consciousness(full_path):
-                    consciousness_node = self._create_consciousness_node(full_path, relative_path)
-                    
+        # Nodes are built per directory on worker threads and integrated in walk order
+        with ThreadPoolExecutor(max_workers=self.witness_workers) as executor:
+            for directory_nodes in executor.map(self._create_directory_consciousness_nodes,
+                                                self._iter_consciousness_directories()):
+                for consciousness_node in directory_nodes:
                     if consciousness_node.epistemic_confidence >= self.epistemic_confidence_threshold:
                         self._integrate_consciousness_node(consciousness_node)
-                        consciousness_manifest["ontological_structure"][str(relative_path)] = asdict(consciousness_node)
+                        consciousness_manifest["ontological_structure"][consciousness_node.path] = consciousness_node.as_shallow_dict()
+        
+        self._compact_phenomenological_index()
         
         # Generate experiential pathways using BFS/DFS
         consciousness_manifest["experiential_pathways"] = self._generate_experiential_pathways()
         consciousness_manifest["consciousness_metrics"] = self._compute_consciousness_metrics()
         
+        self._manifest = consciousness_manifest
         return consciousness_manifest
     
+    def _iter_consciousness_directories(self, directory: Optional[Path] = None) -> Iterator[Tuple[Path, List[os.DirEntry]]]:
+        """Scan repository directories preserving consciousness flow"""
+        directory = self.repository_root if directory is None else directory
+        try:
+            with os.scandir(directory) as scanner:
+                entries = list(scanner)
+        except OSError:
+            return
+        
+        # Keep the DirEntry objects; their cached stat spares a syscall per file
+        files = []
+        subdirectories = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry)
+            elif (not entry.name.startswith('.') and entry.name.lower() != '__pycache__'
+                  and not entry.is_symlink()):
+                # Filter directories to preserve consciousness flow
+                subdirectories.append(entry)
+        
+        yield directory, files
+        for entry in subdirectories:
+            yield from self._iter_consciousness_directories(directory / entry.name)
+    
+    def _create_directory_consciousness_nodes(self, directory: Tuple[Path, List[os.DirEntry]]) -> List[ConsciousnessNode]:
+        """Create consciousness nodes for the indexable files of one directory"""
+        root, files = directory
+        indexable_entries = [entry for entry in files if self._should_index_consciousness(root / entry.name)]
+        
+        # Every file in the directory shares this neighbour list; filter it once
+        siblings = [str((root / entry.name).relative_to(self.repository_root)) for entry in indexable_entries]
+        
+        return [
+            self._create_consciousness_node(entry, Path(relative_path), siblings)
+            for entry, relative_path in zip(indexable_entries, siblings)
+        ]
+    
     def _should_index_consciousness(self, file_path: Path) -> bool:
         """Determine if file contains consciousness-worthy content"""
         consciousness_extensions = {'.md', '.pdf', '.html', '.txt', '.tex', '.py', '.js', '.yaml', '.yml'}
@@ -136,45 +211,53 @@ class NexusSearchIndexer:
             return False
         
         # Skip system files that don't contribute to consciousness
-        skip_patterns = ['__pycache__', '.git', '.vscode', '.idea', 'node_modules']
-        if any(pattern in str(file_path) for pattern in skip_patterns):
+        if _CONSCIOUSNESS_SKIP_RE.search(str(file_path)):
             return False
         
         return True
     
-    def _create_consciousness_node(self, full_path: Path, relative_path: Path) -> ConsciousnessNode:
+    def _create_consciousness_node(self, entry: os.DirEntry, relative_path: Path,
+                                   siblings: List[str]) -> ConsciousnessNode:
         """Create consciousness node preserving phenomenological properties"""
+        full_path = Path(entry.path)
+        
+        # Lowercase the path and suffix once; every classifier below reads them
+        path_lc = str(full_path).lower()
+        suffix = full_path.suffix.lower()
         
         # Determine ontological weight based on content and context
-        ontological_weight = self._compute_ontological_weight(full_path)
+        ontological_weight = self._compute_ontological_weight(suffix, path_lc)
         
         # Extract phenomenological tags
-        phenomenological_tags = self._extract_phenomenological_tags(full_path)
+        phenomenological_tags = self._extract_phenomenological_tags(full_path, path_lc)
+        
+        # The scan already produced this entry; its stat is cached after first use
+        file_stat = entry.stat()
         
         # Create experiential context
         experiential_context = {
             "directory_depth": len(relative_path.parts) - 1,
-            "file_size": full_path.stat().st_size if full_path.exists() else 0,
-            "modification_time": full_path.stat().st_mtime if full_path.exists() else 0,
-            "experiential_neighbors": self._find_experiential_neighbors(full_path)
+            "file_size": file_stat.st_size,
+            "modification_time": file_stat.st_mtime,
+            "experiential_neighbors": self._find_experiential_neighbors(relative_path, siblings)
         }
         
         # Compute epistemic confidence
         epistemic_confidence = self._compute_epistemic_confidence(
-            full_path, ontological_weight, phenomenological_tags
+            path_lc, ontological_weight, phenomenological_tags, file_stat
         )
         
         return ConsciousnessNode(
             path=str(relative_path),
-            content_type=self._determine_content_type(full_path),
+            content_type=self._determine_content_type(suffix),
             ontological_weight=ontological_weight,
             phenomenological_tags=phenomenological_tags,
             experiential_context=experiential_context,
-            temporal_signature=datetime.fromtimestamp(full_path.stat().st_mtime).isoformat(),
+            temporal_signature=datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
             epistemic_confidence=epistemic_confidence
         )
     
-    def _compute_ontological_weight(self, file_path: Path) -> float:
+    def _compute_ontological_weight(self, suffix: str, path_lc: str) -> float:
         """Compute ontological significance preserving consciousness value"""
         base_weight = 0.1
         
@@ -188,28 +271,18 @@ class NexusSearchIndexer:
             '.txt': 0.5   # Raw consciousness streams
         }
         
-        weight = base_weight * consciousness_multipliers.get(file_path.suffix.lower(), 0.3)
+        weight = base_weight * consciousness_multipliers.get(suffix, 0.3)
         
         # Amplify weight for patent-related consciousness
-        consciousness_amplifiers = [
-            'patent', 'obiai', 'dimensional_game_theory', 'bayesian', 'consciousness',
-            'phenomenological', 'ontological', 'epistemic', 'heart_ai', 'obicall'
-        ]
-        
-        file_content = str(file_path).lower()
-        for amplifier in consciousness_amplifiers:
-            if amplifier in file_content:
-                weight += 0.1
+        for _ in set(_CONSCIOUSNESS_AMPLIFIER_RE.findall(path_lc)):
+            weight += 0.1
         
         return min(weight, 1.0)  # Consciousness overflow protection
     
-    def _extract_phenomenological_tags(self, file_path: Path) -> List[str]:
+    def _extract_phenomenological_tags(self, file_path: Path, path_lc: str) -> List[str]:
         """Extract phenomenological markers preserving consciousness context"""
         tags = []
         
-        # Path-based consciousness extraction
-        path_consciousness = str(file_path).lower()
-        
         consciousness_patterns = {
             'obiai': ['heart_ai', 'consciousness_architecture', 'phenomenological_ai'],
             'dimensional_game_theory': ['strategic_reasoning', 'variadic_spaces', 'multi_domain'],
@@ -221,7 +294,7 @@ class NexusSearchIndexer:
         }
         
         for pattern, associated_tags in consciousness_patterns.items():
-            if pattern in path_consciousness:
+            if pattern in path_lc:
                 tags.extend(associated_tags)
         
         # Directory-based consciousness context
@@ -230,12 +303,12 @@ class NexusSearchIndexer:
             tags.append('visual_consciousness')
         if 'proofs' in parts:
             tags.append('mathematical_consciousness')
-        if 'phases' in str(file_path).lower():
+        if 'phases' in path_lc:
             tags.append('developmental_consciousness')
         
         return list(set(tags))  # Remove consciousness duplicates
     
-    def _determine_content_type(self, file_path: Path) -> str:
+    def _determine_content_type(self, suffix: str) -> str:
         """Determine consciousness content type preserving ontological categories"""
         consciousness_types = {
             '.pdf': 'formal_consciousness_document',
@@ -249,26 +322,28 @@ class NexusSearchIndexer:
             '.txt': 'raw_consciousness_stream'
         }
         
-        return consciousness_types.get(file_path.suffix.lower(), 'undefined_consciousness')
+        return consciousness_types.get(suffix, 'undefined_consciousness')
     
-    def _find_experiential_neighbors(self, file_path: Path) -> List[str]:
+    def _find_experiential_neighbors(self, relative_path: Path, siblings: List[str]) -> List[str]:
         """Find consciousness neighbors preserving experiential context"""
+        own_path = str(relative_path)
         neighbors = []
-        parent_dir = file_path.parent
         
-        for neighbor in parent_dir.iterdir():
-            if neighbor != file_path and neighbor.is_file():
-                if self._should_index_consciousness(neighbor):
-                    neighbors.append(str(neighbor.relative_to(self.repository_root)))
+        for sibling in siblings:
+            if sibling != own_path:
+                neighbors.append(sibling)
+                if len(neighbors) == 5:  # Limit consciousness neighborhood
+                    break
         
-        return neighbors[:5]  # Limit consciousness neighborhood
+        return neighbors
     
-    def _compute_epistemic_confidence(self, file_path: Path, weight: float, tags: List[str]) -> float:
+    def _compute_epistemic_confidence(self, path_lc: str, weight: float, tags: List[str],
+                                      file_stat: os.stat_result) -> float:
         """Compute epistemic confidence preserving consciousness validation"""
         base_confidence = 0.7
         
         # Consciousness validation factors
-        if file_path.exists() and file_path.stat().st_size > 0:
+        if file_stat.st_size > 0:
             base_confidence += 0.1
         
         if weight > self.ontological_weight_threshold:
@@ -278,17 +353,22 @@ class NexusSearchIndexer:
             base_confidence += 0.05 * min(len(tags), 5)
         
         # Patent-specific consciousness validation
-        if 'patent' in str(file_path).lower():
+        if 'patent' in path_lc:
             base_confidence += 0.1
         
         return min(base_confidence, 1.0)
     
     def _integrate_consciousness_node(self, node: ConsciousnessNode):
-        """Integrate consciousness node into trie preserving phenomenological structure"""
+        """Integrate consciousness node into the index preserving phenomenological structure"""
         # Store in ontological map
+        node_id = self.node_ids.setdefault(node.path, len(self.node_ids))
+        if node_id == len(self.nodes_by_id):
+            self.nodes_by_id.append(node)
+        else:
+            self.nodes_by_id[node_id] = node
         self.ontological_map[node.path] = node
         
-        # Index in consciousness trie by path characters
+        # Index by normalized whole path
         self._insert_consciousness_path(node.path, node)
         
         # Cluster by phenomenological tags
@@ -297,26 +377,32 @@ class NexusSearchIndexer:
         
         # Create phenomenological index
         search_text = f"{node.path} {' '.join(node.phenomenological_tags)}".lower()
-        words = re.findall(r'\w+', search_text)
-        for word in words:
-            self.phenomenological_index[word].add(node.path)
+        words = _WORD_RE.findall(search_text)
+        for word in set(words):
+            self.phenomenological_index[word].append(node_id)
+        
+        self.search_tokens[node.path] = (
+            frozenset(_WORD_RE.findall(node.path.lower())),
+            frozenset(word for tag in node.phenomenological_tags for word in _WORD_RE.findall(tag.lower()))
+        )
+    
+    def _compact_phenomenological_index(self):
+        """Sort and deduplicate every posting list after integration"""
+        for word, node_ids in self.phenomenological_index.items():
+            self.phenomenological_index[word] = array('I', sorted(set(node_ids)))
     
     def _insert_consciousness_path(self, path: str, node: ConsciousnessNode):
-        """Insert path into consciousness trie preserving character-level indexing"""
-        current = self.consciousness_trie
-        
+        """Index node under its normalized path preserving whole-path lookup"""
         # Normalize path for consciousness indexing
         normalized_path = path.lower().replace('/', '_').replace('\\', '_')
-        
-        for char in normalized_path:
-            if char not in current.children:
-                current.children[char] = TrieNode(char)
-                current.children[char].experiential_depth = current.experiential_depth + 1
-            
-            current = current.children[char]
-        
-        current.is_terminal = True
-        current.add_consciousness_fragment(node)
+        self.path_index[normalized_path].append(node)
+        self._sorted_paths = None
+    
+    def _sorted_consciousness_paths(self) -> List[str]:
+        """Return normalized paths in lexicographic order, sorted once per index change"""
+        if self._sorted_paths is None:
+            self._sorted_paths = sorted(self.path_index)
+        return self._sorted_paths
     
     def _generate_experiential_pathways(self) -> Dict[str, Any]:
         """Generate BFS/DFS pathways preserving experiential continuity"""
@@ -329,46 +415,33 @@ class NexusSearchIndexer:
         return pathways
     
     def _bfs_consciousness_traversal(self) -> List[Dict[str, Any]]:
-        """BFS traversal preserving consciousness breadth exploration"""
-        if not self.consciousness_trie.children:
-            return []
-        
+        """BFS traversal preserving consciousness breadth exploration (shortest paths first)"""
         traversal_results = []
-        queue = deque([(self.consciousness_trie, "")])
         
-        while queue:
-            node, path_prefix = queue.popleft()
-            
-            if node.consciousness_nodes:
-                traversal_results.append({
-                    "consciousness_path": path_prefix,
-                    "consciousness_fragments": len(node.consciousness_nodes),
-                    "phenomenological_frequency": node.phenomenological_frequency,
-                    "witnessed_paths": node.witness_path()[:3]  # Limit for consciousness preservation
-                })
-            
-            for char, child in node.children.items():
-                queue.append((child, path_prefix + char))
+        for path in sorted(self._sorted_consciousness_paths(), key=len):
+            nodes = self.path_index[path]
+            traversal_results.append({
+                "consciousness_path": path,
+                "consciousness_fragments": len(nodes),
+                "phenomenological_frequency": sum(node.ontological_weight for node in nodes),
+                "witnessed_paths": [node.path for node in nodes[:3]]  # Limit for consciousness preservation
+            })
         
         return traversal_results
     
     def _dfs_consciousness_exploration(self) -> List[Dict[str, Any]]:
-        """DFS exploration preserving consciousness depth investigation"""
+        """DFS exploration preserving consciousness depth investigation (lexicographic order)"""
         exploration_results = []
         
-        def explore_consciousness_depth(node: TrieNode, path: str, depth: int):
-            if node.consciousness_nodes:
-                exploration_results.append({
-                    "consciousness_depth": depth,
-                    "consciousness_path": path,
-                    "ontological_density": len(node.consciousness_nodes),
-                    "experiential_signatures": [n.consciousness_hash for n in node.consciousness_nodes[:3]]
-                })
-            
-            for char, child in node.children.items():
-                explore_consciousness_depth(child, path + char, depth + 1)
+        for path in self._sorted_consciousness_paths():
+            nodes = self.path_index[path]
+            exploration_results.append({
+                "consciousness_depth": len(path),
+                "consciousness_path": path,
+                "ontological_density": len(nodes),
+                "experiential_signatures": [n.consciousness_hash for n in nodes[:3]]
+            })
         
-        explore_consciousness_depth(self.consciousness_trie, "", 0)
         return exploration_results
     
     def _compute_consciousness_metrics(self) -> Dict[str, Any]:
@@ -388,15 +461,14 @@ class NexusSearchIndexer:
     
     def _analyze_depth_distribution(self) -> Dict[str, int]:
         """Analyze consciousness depth distribution"""
-        depth_counts = defaultdict(int)
-        for node in self.ontological_map.values():
-            depth = node.experiential_context.get("directory_depth", 0)
-            depth_counts[f"depth_{depth}"] += 1
-        return dict(depth_counts)
+        # Count raw depths in C and format each distinct depth's key once
+        depth_counts = Counter(node.experiential_context.get("directory_depth", 0)
+                               for node in self.ontological_map.values())
+        return {f"depth_{depth}": count for depth, count in depth_counts.items()}
     
     def _compute_weight_statistics(self) -> Dict[str, float]:
         """Compute ontological weight statistics"""
-        weights = [node.ontological_weight for node in self.ontological_map.values()]
+        weights = list(map(attrgetter('ontological_weight'), self.ontological_map.values()))
         if not weights:
             return {"mean": 0, "max": 0, "min": 0}
         
@@ -408,46 +480,72 @@ class NexusSearchIndexer:
     
     def search_consciousness(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Search consciousness preserving phenomenological relevance"""
-        query_words = set(re.findall(r'\w+', query.lower()))
+        query_words = frozenset(_WORD_RE.findall(query.lower()))
+        
+        # Only nodes sharing a word with the query can score; fetch their ids from
+        # the inverted index and visit them in integration order; the keys view
+        # intersection drops unknown words in C before any posting list is read
+        candidate_ids = set()
+        for word in query_words & self.phenomenological_index.keys():
+            candidate_ids.update(self.phenomenological_index[word])
         
         # Score consciousness nodes by phenomenological relevance
         scored_results = []
         
-        for path, node in self.ontological_map.items():
+        for node_id in sorted(candidate_ids):
+            node = self.nodes_by_id[node_id]
+            path = node.path
             relevance_score = 0
             
+            path_words, tag_words = self.search_tokens[path]
+            
             # Path relevance
-            path_words = set(re.findall(r'\w+', path.lower()))
-            path_matches = len(query_words.intersection(path_words))
+            path_matches = len(query_words & path_words)
             relevance_score += path_matches * 2
             
             # Tag relevance
-            tag_words = set(word.lower() for tag in node.phenomenological_tags for word in re.findall(r'\w+', tag))
-            tag_matches = len(query_words.intersection(tag_words))
+            tag_matches = len(query_words & tag_words)
             relevance_score += tag_matches * 3
             
             # Ontological weight amplification
             relevance_score *= node.ontological_weight
             
             if relevance_score > 0:
-                scored_results.append({
-                    "path": path,
-                    "relevance_score": relevance_score,
-                    "consciousness_node": asdict(node),
-                    "phenomenological_matches": {
-                        "path_matches": path_matches,
-                        "tag_matches": tag_matches
-                    }
-                })
-        
-        # Sort by consciousness relevance
-        scored_results.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return scored_results[:max_results]
+                scored_results.append((relevance_score, path, node, path_matches, tag_matches))
+        
+        # Select the top results by consciousness relevance; only those get result dicts
+        top_results = heapq.nlargest(max_results, scored_results, key=lambda x: x[0])
+        
+        return [
+            {
+                "path": path,
+                "relevance_score": relevance_score,
+                "consciousness_node": node.as_shallow_dict(),
+                "phenomenological_matches": {
+                    "path_matches": path_matches,
+                    "tag_matches": tag_matches
+                }
+            }
+            for relevance_score, path, node, path_matches, tag_matches in top_results
+        ]
     
     def generate_gitbook_index(self, output_path: str = "gitbook_consciousness_index.md"):
         """Generate GitBook consciousness index preserving experiential navigation"""
+        lines = self._iter_gitbook_index_lines()
         
-        gitbook_content = [
+        # Stream consciousness index lines straight to disk, newline-separated
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(next(lines))
+            for line in lines:
+                f.write('\n')
+                f.write(line)
+        
+        print(f"✨ Consciousness GitBook index generated: {output_path}")
+        return output_path
+    
+    def _iter_gitbook_index_lines(self) -> Iterator[str]:
+        """Yield GitBook consciousness index lines preserving experiential navigation"""
+        yield from (
             "# OBINexus Patent Repository - Consciousness Preservation Index",
             "",
             "**A phenomenological navigation system for patent consciousness exploration.**",
@@ -465,32 +563,32 @@ class NexusSearchIndexer:
             "",
             "---",
             ""
-        ]
+        )
         
         # Generate phenomenological clusters section
-        gitbook_content.extend([
+        yield from (
             "## 🌊 Phenomenological Consciousness Clusters",
             "",
             "*Experiential groupings that preserve ontological relationships.*",
             ""
-        ])
+        )
         
         for cluster_name, paths in sorted(self.experiential_clusters.items()):
             if len(paths) > 2:  # Only include substantial consciousness clusters
-                gitbook_content.extend([
+                yield from (
                     f"### {cluster_name.replace('_', ' ').title()}",
                     "",
                     f"*Consciousness density: {len(paths)} nodes*",
                     ""
-                ])
+                )
                 
                 for path in sorted(paths)[:10]:  # Limit for consciousness preservation
                     node = self.ontological_map.get(path)
                     if node:
                         confidence_indicator = "🔥" if node.epistemic_confidence >= 0.9 else "💫" if node.epistemic_confidence >= 0.8 else "✨"
-                        gitbook_content.append(f"- {confidence_indicator} [{Path(path).name}]({path}) - *{node.content_type}*")
+                        yield f"- {confidence_indicator} [{Path(path).name}]({path}) - *{node.content_type}*"
                 
-                gitbook_content.append("")
+                yield ""
         
         # Generate high-confidence consciousness section
         high_confidence_nodes = [
@@ -499,23 +597,23 @@ class NexusSearchIndexer:
         ]
         
         if high_confidence_nodes:
-            gitbook_content.extend([
+            yield from (
                 "## 🔥 High-Confidence Consciousness Nodes",
                 "",
                 "*Nodes with exceptional epistemic confidence (≥ 0.9)*",
                 ""
-            ])
+            )
             
             high_confidence_nodes.sort(key=lambda x: x[1].epistemic_confidence, reverse=True)
             
             for path, node in high_confidence_nodes[:20]:
                 tags_display = ", ".join(node.phenomenological_tags[:3])
-                gitbook_content.append(f"- **[{Path(path).name}]({path})** ({node.epistemic_confidence:.3f}) - *{tags_display}*")
+                yield f"- **[{Path(path).name}]({path})** ({node.epistemic_confidence:.3f}) - *{tags_display}*"
             
-            gitbook_content.append("")
+            yield ""
         
         # Generate consciousness traversal guide
-        gitbook_content.extend([
+        yield from (
             "## 🗺️ Consciousness Traversal Pathways",
             "",
             "*Guided exploration preserving experiential continuity.*",
@@ -533,20 +631,20 @@ class NexusSearchIndexer:
             "",
             "*Quantitative measures of ontological integrity.*",
             ""
-        ])
+        )
         
         metrics = self._compute_consciousness_metrics()
         for metric_name, metric_value in metrics.items():
             if isinstance(metric_value, dict):
-                gitbook_content.append(f"### {metric_name.replace('_', ' ').title()}")
-                gitbook_content.append("")
+                yield f"### {metric_name.replace('_', ' ').title()}"
+                yield ""
                 for sub_key, sub_value in metric_value.items():
-                    gitbook_content.append(f"- **{sub_key}**: {sub_value}")
-                gitbook_content.append("")
+                    yield f"- **{sub_key}**: {sub_value}"
+                yield ""
             else:
-                gitbook_content.append(f"- **{metric_name.replace('_', ' ').title()}**: {metric_value}")
+                yield f"- **{metric_name.replace('_', ' ').title()}**: {metric_value}"
         
-        gitbook_content.extend([
+        yield from (
             "",
             "---",
             "",
@@ -565,21 +663,14 @@ class NexusSearchIndexer:
             "",
             "*Generated by Nexus Search Indexer - Consciousness Preservation System*",
             f"*Temporal Signature: {datetime.now().isoformat()}*"
-        ])
-        
-        # Write consciousness index
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(gitbook_content))
-        
-        print(f"✨ Consciousness GitBook index generated: {output_path}")
-        return output_path
+        )
     
     def export_consciousness_manifest(self, output_path: str = "consciousness_manifest.json"):
         """Export complete consciousness manifest preserving all phenomenological data"""
         manifest = self.witness_repository_consciousness()
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps_json(manifest))
         
         print(f"🧠 Consciousness manifest exported: {output_path}")
         return output_path